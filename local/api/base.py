@@ -2,12 +2,13 @@
 Provides `TisV2Api`, a class to call the TOPMed Imputation Server endpoints (either `dev` or `prod`) programmatically.
 """
 
+from datetime import datetime
 from pathlib import Path
-from getpass import getpass
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Any, Iterable
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
 from tqdm import tqdm
 from pretty_cli import PrettyCli
@@ -15,13 +16,30 @@ from pretty_cli import PrettyCli
 from local import ansi_colors
 from local.request_schema import JobParams, AdminListJobsState
 from local.response_schema import JobInfo, JobResponse, JobState, UserResponse, LoginResponse, RefpanelResponse, PopulationResponse, DownloadInfo, ServerResponse
-from local.util import get_user_agent
+from local.util import get_user_agent, write_token_file
+
+# orjson (C, SIMD-accelerated) decodes the large list endpoints noticeably faster than the
+# stdlib; it is an optional extra, so fall back transparently when it is not installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 def _get_bar(desc: str, total: int) -> tqdm:
     return tqdm(desc=desc, total=total, unit="B", unit_scale=True, unit_divisor=1024)
 
 
+def _decode_json(response: requests.Response) -> Any:
+    """Decodes a JSON response body from the raw bytes, skipping requests' encoding sniffing."""
+    return _json_loads(response.content)
+
+
+# Built once at import; admin_kill_all reuses them instead of re-iterating the enums per call.
+_ALL_LIST_STATES       = tuple(AdminListJobsState)
+_CANCELABLE_JOB_STATES = frozenset({ JobState.RUNNING, JobState.WAITING, JobState.EXPORTING })
+
+
 @dataclass
 class AdminKillAllResponse:
     killed : list[JobResponse]
@@ -59,6 +77,8 @@ class TisV2Api:
     cli          : PrettyCli
     user_agent   : str
 
+    _session     : requests.Session # Long-lived connection pool shared by all calls from this instance.
+
     access_token_path : Path | None
     admin_token_path  : Path | None
     access_token      : str  | None
@@ -100,6 +120,24 @@ class TisV2Api:
         self.access_token = None
         self.admin_token  = None
 
+        # One pooled session for the lifetime of this instance: repeated calls against the
+        # same server reuse the TCP+TLS connection instead of re-handshaking per request.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Static headers are set once on the session instead of being rebuilt per request.
+        # The session's default Accept-Encoding already negotiates gzip/deflate (and brotli
+        # or zstd when the decoders are installed), which matters on the list endpoints whose
+        # JSON is dominated by repeated keys; don't override it, or urllib3 may advertise a
+        # codec it cannot decode.
+        self._session.headers["User-Agent"] = self.user_agent
+
+    def close(self) -> None:
+        """Closes the underlying HTTP session, releasing its pooled connections."""
+        self._session.close()
+
     def _get_token_path(self, admin: bool = False) -> Path:
         """
         Returns the expected path to the token file:
@@ -174,6 +212,9 @@ class TisV2Api:
         * For admin-level operations, performs interactive login to obtain a short-lived full-rights token.
         """
         if admin:
+            # Imported here: only the interactive login path needs getpass (and its termios pull).
+            from getpass import getpass
+
             username = input(f"No token file found for admin access to environment '{self.env_name}'. Will attempt login.\nUsername: ")
             password = getpass()
             response = self.admin_login(username, password)
@@ -181,8 +222,7 @@ class TisV2Api:
         else:
             token = input(f"No token file found for current environment '{self.env_name}'. Please enter a valid token:")
 
-        with open(token_path, "w") as file_handle:
-            file_handle.write(token)
+        write_token_file(token_path, token)
 
     def _request(self, **kwargs) -> requests.Response:
         """
@@ -221,7 +261,6 @@ class TisV2Api:
 
         headers = {
             "X-Auth-Token" : self._get_access_token(admin),
-            "User-Agent"   : self.user_agent,
         }
 
         if self.print_http_call:
@@ -256,10 +295,10 @@ class TisV2Api:
                 m = MultipartEncoderMonitor(e, callback)
 
                 headers = headers | { "Content-Type": m.content_type }
-                response = requests.request(method=method, url=self.base_url + url, headers=headers, data=m, **kwargs)
+                response = self._session.request(method=method, url=self.base_url + url, headers=headers, data=m, **kwargs)
 
         else:
-            response = requests.request(method=method, url=self.base_url + url, headers=headers, **kwargs)
+            response = self._session.request(method=method, url=self.base_url + url, headers=headers, **kwargs)
 
         if self.print_http_call:
             color = ansi_colors.FG_GREEN if response.ok else ansi_colors.FG_RED
@@ -287,42 +326,65 @@ class TisV2Api:
         """self._request() wrapper for all internal POST calls."""
         return self._request(method="POST", url=url, data=data, json=json, monitor_progress=monitor_progress, **kwargs)
 
-    def list_jobs(self) -> list[JobInfo]:
-        """Lists all jobs submitted by the current user (regardless of current status)."""
-        response = self._get(url="api/v2/jobs")
+    def list_jobs(self, start_time: datetime | None = None, end_time: datetime | None = None, parse_response: bool = True) -> list[JobInfo] | list[Any]:
+        """
+        Lists all jobs submitted by the current user (regardless of current status).
+
+        Optional time bounds are forwarded as ISO 8601 query parameters so servers that
+        support them only transfer the matching window; callers should still filter
+        client-side, since servers that don't know the parameters ignore them.
+
+        With `parse_response=False`, returns the raw JSON entries without building
+        `JobInfo` instances (useful when the caller discards the result anyway).
+        """
+
+        params = {}
+        if start_time is not None:
+            params["start_time"] = start_time.isoformat()
+        if end_time is not None:
+            params["end_time"] = end_time.isoformat()
+
+        response = self._get(url="api/v2/jobs", params=(params or None))
 
         if not response.ok:
             return []
 
-        json_data = response.json()["data"]
+        json_data = _decode_json(response)["data"]
+
+        if not parse_response:
+            return json_data
+
         jobs = [ JobInfo.from_json(entry) for entry in json_data ]
 
         return jobs
 
+    def get_job_json(self, id: str) -> Any:
+        """Gets detailed information about the requested job, as the raw JSON payload."""
+        response = self._get(url=f"api/v2/jobs/{id}")
+        return _decode_json(response)
+
     def get_job(self, id: str) -> JobInfo:
         """Gets detailed information about the requested job."""
-        response = self._get(url=f"api/v2/jobs/{id}")
-        job_json = response.json()
-        return JobInfo.from_json(job_json)
+        return JobInfo.from_json(self.get_job_json(id))
 
     def submit_job(self, params: JobParams) -> JobResponse:
         """Submits a job for processing."""
         response = self._post(url="api/v2/jobs/submit/imputationserver2", files=params.get_params(), monitor_progress=True)
 
         try:
-            return JobResponse.from_json(response.json())
+            return JobResponse.from_json(_decode_json(response))
         except:
             return JobResponse.fail()
 
     def cancel_job(self, id: str) -> JobInfo:
         """Cancels the specified job."""
         response = self._get(url=f"api/v2/jobs/{id}/cancel")
-        return JobInfo.from_json(response.json())
+        return JobInfo.from_json(_decode_json(response))
 
     def restart_job(self, id: str) -> JobResponse:
         """Retries the specified job (must be in a `DEAD` state)."""
         response = self._get(url=f"api/v2/jobs/{id}/restart")
-        return JobResponse.from_json(response.json())
+        return JobResponse.from_json(_decode_json(response))
 
     def list_refpanels(self) -> list[RefpanelResponse]:
         """
@@ -334,7 +396,7 @@ class TisV2Api:
         if not response.ok:
             return []
 
-        data = response.json()
+        data = _decode_json(response)
 
         refpanel_data       = next(entry for entry in data["params"] if entry["id"] == "refpanel")
         all_population_data = next(entry for entry in data["params"] if entry["id"] == "population")
@@ -395,14 +457,14 @@ class TisV2Api:
         """
 
         response = self._get(url="api/v2/server")
-        return ServerResponse.from_json(response.json())
+        return ServerResponse.from_json(_decode_json(response))
 
     def admin_login(self, username: str, password: str) -> LoginResponse:
         """Requests an admin-level token from the server."""
 
         # TODO: Optionally save the token to disk.
         response = self._post(url="login", data={ "username": username, "password": password })
-        return LoginResponse.from_json(response.json())
+        return LoginResponse.from_json(_decode_json(response))
 
     def admin_list_users(self) -> list[UserResponse]:
         """Calls the admin user listing endpoint. Requires admin rights."""
@@ -410,16 +472,19 @@ class TisV2Api:
         response = self._get(url="api/v2/admin/users", admin=True)
 
         if response.ok:
-            users = response.json()["data"]
+            users = _decode_json(response)["data"]
             users = [ UserResponse.from_json(u) for u in users ]
             return users
         else:
             return []
 
-    def admin_list_jobs(self, states: Iterable[AdminListJobsState]) -> list[JobInfo]:
+    def admin_list_jobs(self, states: Iterable[AdminListJobsState], parse_response: bool = True) -> list[JobInfo] | list[Any]:
         """
         Calls the admin job listing endpoint. Requires at least one state filter to produce
         output (see `AdminListJobsState`). Requires admin rights.
+
+        With `parse_response=False`, returns the raw JSON entries without building
+        `JobInfo` instances (useful when the caller discards the result anyway).
         """
 
         jobs = []
@@ -430,8 +495,12 @@ class TisV2Api:
             if not response.ok:
                 return []
 
-            json_data = response.json()["data"]
-            jobs += [ JobInfo.from_json(entry) for entry in json_data ]
+            json_data = _decode_json(response)["data"]
+
+            if parse_response:
+                jobs += [ JobInfo.from_json(entry) for entry in json_data ]
+            else:
+                jobs += json_data
 
         return jobs
 
@@ -440,11 +509,8 @@ class TisV2Api:
         killed = []
         failed = []
 
-        all_list_states = [ s for s in AdminListJobsState ]
-        cancelable_job_states = [ JobState.RUNNING, JobState.WAITING, JobState.EXPORTING ]
-
-        for job in self.admin_list_jobs(states=all_list_states):
-            if job.state not in cancelable_job_states:
+        for job in self.admin_list_jobs(states=_ALL_LIST_STATES):
+            if job.state not in _CANCELABLE_JOB_STATES:
                 continue
 
             response = self.cancel_job(id=job.id)
@@ -3,13 +3,97 @@ Provides everything needed to run commands from the CLI.
 """
 
 
+import gc
+import sys
+import time
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from pretty_cli import PrettyCli
 
 from . import base, version, job, admin, server, query
 
 
+# Commands that will need the server registry loaded before they can do any work.
+_PREWARM_COMMANDS = frozenset([ base.Command.SERVER, base.Command.QUERY, base.Command.JOB, base.Command.ADMIN ])
+
+# Global options that consume a following value; the subcommand sniffer must skip their
+# arguments when scanning for the first positional token. Keep in sync with register_base_args.
+_VALUE_OPTIONS = frozenset([ "--token-file", "--repeat", "--delay", "--initial-delay", "--concurrency", "--output" ])
+
+# Maps each subcommand to the function that attaches its subparser.
+_PARSER_REGISTRARS = {
+    base.Command.VERSION : version.register_version_parser,
+    base.Command.SERVER  : server.register_server_parser,
+    base.Command.QUERY   : query.register_query_parser,
+    base.Command.JOB     : job.register_job_parser,
+    base.Command.ADMIN   : admin.register_admin_parser,
+}
+
+# Maps each subcommand to the function that turns the raw namespace into its Args dataclass.
+_COMMAND_PARSERS = {
+    base.Command.VERSION : version.parse_version_command,
+    base.Command.SERVER  : server.parse_server_command,
+    base.Command.QUERY   : query.parse_query_command,
+    base.Command.JOB     : job.parse_job_command,
+    base.Command.ADMIN   : admin.parse_admin_command,
+}
+
+
+def _sniff_command() -> base.Command | None:
+    """
+    Best-effort scan of `sys.argv` for the requested subcommand (the first positional
+    token, skipping global options and their values). Returns `None` when no known
+    subcommand is found — e.g. a bare `--help` or a typo — in which case callers should
+    fall back to the full parser tree so argparse can produce its usual help/error output.
+    """
+
+    skip_next = False
+
+    for arg in sys.argv[1:]:
+        if skip_next:
+            skip_next = False
+            continue
+
+        if arg.startswith("-"):
+            skip_next = (arg in _VALUE_OPTIONS)
+            continue
+
+        try:
+            return base.Command(arg)
+        except ValueError:
+            return None
+
+    return None
+
+
+def _maybe_prewarm_servers() -> None:
+    """
+    If the command line names a subcommand that needs the server registry, kick off the
+    YAML load in a background thread so it overlaps with argument parsing.
+
+    `lookup._check_servers()` is lock-guarded, so the synchronous path either joins the
+    prewarmed result or performs the load itself; if the subcommand never needs servers,
+    the thread result is simply discarded.
+
+    The prewarm only fires when the registry file already exists: a first-run load would
+    *write* the default registry, and a daemon thread frozen at interpreter exit (e.g.
+    `--help` returning immediately) must never be mid-write. With the file present the
+    thread is a pure read, so killing it early is harmless.
+    """
+
+    if _sniff_command() not in _PREWARM_COMMANDS:
+        return
+
+    from local.server import lookup
+
+    if not lookup._SERVERS_FILE.is_file():
+        return
+
+    threading.Thread(target=lookup._check_servers, daemon=True).start()
+
+
 def parse_arguments() -> base.Args:
     parser = argparse.ArgumentParser(description="Query the TOPMed Imputation Server API")
 
@@ -17,41 +101,106 @@ def parse_arguments() -> base.Args:
 
     subparsers = parser.add_subparsers(title="Commands", dest="command", required=True)
 
-    version.register_version_parser(subparsers)
-    server.register_server_parser(subparsers)
-    query.register_query_parser(subparsers)
-    job.register_job_parser(subparsers)
-    admin.register_admin_parser(subparsers)
+    # Attach only the subparser the command line actually names; the full tree is only
+    # built when no subcommand could be sniffed (bare --help, typos), so argparse can
+    # still list every command in its help and error output.
+    sniffed = _sniff_command()
+
+    if sniffed is not None:
+        _PARSER_REGISTRARS[sniffed](subparsers)
+    else:
+        for registrar in _PARSER_REGISTRARS.values():
+            registrar(subparsers)
 
     raw_args = parser.parse_args()
 
-    command = base.Command(raw_args.command)
+    # The sniffer already resolved the enum member; only fall back to constructing it from
+    # the parsed string when the full tree was built.
+    command = sniffed if sniffed is not None else base.Command(raw_args.command)
 
     global_args = base.Args(
         debug        = raw_args.debug,
         output_style = raw_args.output_style,
         token_file   = raw_args.token_file,
+        repeat        = raw_args.repeat,
+        delay         = raw_args.delay,
+        initial_delay = raw_args.initial_delay,
+        concurrency   = raw_args.concurrency,
         command      = command,
     )
 
-    match command:
-        case base.Command.VERSION:
-            return version.parse_version_command(raw_args, global_args)
-        case base.Command.SERVER:
-            return server.parse_server_command(raw_args, global_args)
-        case base.Command.QUERY:
-            return query.parse_query_command(raw_args, global_args)
-        case base.Command.JOB:
-            return job.parse_job_command(raw_args, global_args)
-        case base.Command.ADMIN:
-            return admin.parse_admin_command(raw_args, global_args)
-        case _:
-            raise ValueError(f"Unrecognized command: {command}")
+    parse_command = _COMMAND_PARSERS.get(command)
 
-    assert False, f"Unrecognized command: {command}"
+    if parse_command is None:
+        raise ValueError(f"Unrecognized command: {command}")
+
+    # Some validation runs after parse_args() returns (e.g. the batched file checks in
+    # parse_job_command); route those failures through the parser so the user still gets
+    # the usual usage message and exit code 2 instead of a traceback.
+    try:
+        return parse_command(raw_args, global_args)
+    except argparse.ArgumentTypeError as error:
+        parser.error(str(error))
 
 
 def run_cli() -> None:
     cli = PrettyCli()
+    _maybe_prewarm_servers()
     args = parse_arguments()
-    args.run_command(cli)
+
+    # One-off startup wait; the in-loop --delay only ever sleeps *between* launches, so the
+    # two never compound.
+    initial_s = args.initial_delay.total_seconds()
+    if initial_s > 0:
+        time.sleep(initial_s)
+
+    # The finally clause guarantees the cached HTTP session (and any other resources held
+    # across repeats) is released even when a repeat raises or the loop exits early.
+    try:
+        if args.concurrency > 1 and args.repeat > 1:
+            if not type(args).parallel_safe:
+                cli.print(f"Command '{args.command}' has side effects; ignoring --concurrency and running serially.")
+            else:
+                # Read-only repeats fan out over a thread pool; each worker call builds its own
+                # API instance (closed per call), so the underlying HTTP sessions are never
+                # shared across threads.
+                run = args.run_command # Bound once; skips the attribute lookup per submission.
+
+                # The first run happens synchronously so any interactive token resolution
+                # prompts exactly once (and fails fast) before workers fan out; the remaining
+                # repeats then find the token file in place instead of racing over the prompt.
+                if run(cli) is False:
+                    return
+
+                workers = min(args.concurrency, args.repeat - 1)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [ pool.submit(run, cli) for _ in range(args.repeat - 1) ]
+                    for future in as_completed(futures):
+                        future.result() # Surface any worker exception.
+                return
+
+        if args.repeat > 1:
+            # parse_arguments' locals (the parser tree and raw namespace) died on return; collect
+            # the cycles now so a long polling run starts from a compact heap instead of carrying
+            # the parser graph until the collector happens to trigger mid-loop.
+            gc.collect()
+
+        # Deadline-based scheduling: each launch is pinned to `next_deadline`, so the command's
+        # own latency overlaps the delay window instead of adding to it, and long runs don't drift.
+        delay_s = args.delay.total_seconds()
+        next_deadline = time.monotonic()
+        run = args.run_command # Bound once outside the loop; the hot path only does LOAD_FAST.
+
+        for _ in range(args.repeat):
+            now = time.monotonic()
+            if next_deadline > now:
+                time.sleep(next_deadline - now)
+
+            if run(cli) is False:
+                # The command reported that repeating is pointless (e.g. the polled job reached
+                # a terminal state); stop early instead of spamming the server.
+                break
+
+            next_deadline += delay_s
+    finally:
+        args.cleanup()
@@ -3,20 +3,21 @@ Provides admin-level commands.
 """
 
 
-from getpass import getpass
 from datetime import datetime
 from pathlib import Path
 from enum import StrEnum
 from dataclasses import dataclass, asdict
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from local.server import Server
-from local.api import TisV2Api
 from local.request_schema import AdminListJobsState
-from local.util import check_datetime
+from local.util import check_datetime, write_token_file
 
 from . import base
 
+if TYPE_CHECKING:
+    from local.api import TisV2Api
+
 
 class AdminCommand(StrEnum):
     LOGIN      = "login"
@@ -25,54 +26,68 @@ class AdminCommand(StrEnum):
     KILL_ALL   = "kill-all"
 
 
-@dataclass
+# Built once at import; parser construction reuses it instead of re-iterating the enum.
+_ADMIN_JOB_STATE_CHOICES = tuple(AdminListJobsState)
+
+
+@dataclass(slots=True)
 class AdminArgs(base.ApiArgs):
     admin_command: AdminCommand
 
 
-@dataclass
+@dataclass(slots=True)
 class AdminLogin(AdminArgs):
     username : str | None
     password : str | None
 
-    def run_subcommand(self, api: TisV2Api) -> None:
+    def run_subcommand(self, api: "TisV2Api") -> None:
         if self.username is None:
             self.username = input("Username: ")
         if self.password is None:
+            # Imported here: only the interactive login path needs getpass (and its termios pull).
+            from getpass import getpass
             self.password = getpass()
 
         response = api.admin_login(self.username, self.password)
         token_path = Path("data") / f"{self.server.id}-admin.token"
 
-        with open(token_path, "w") as file:
-            file.write(response.access_token)
+        write_token_file(token_path, response.access_token)
 
         response.access_token = None
         self.output(api.cli, response)
 
 
-@dataclass
+@dataclass(slots=True)
 class AdminListUsers(AdminArgs):
-    def run_subcommand(self, api: TisV2Api) -> None:
+    parallel_safe = True
+
+    def run_subcommand(self, api: "TisV2Api") -> None:
         users = api.admin_list_users()
         self.output(api.cli, users)
 
 
-@dataclass
+@dataclass(slots=True)
 class AdminListJobs(AdminArgs):
+    parallel_safe = True
+
     states: list[AdminListJobsState]
     start_time : datetime | None
     end_time   : datetime | None
 
-    def run_subcommand(self, api: TisV2Api) -> None:
+    def run_subcommand(self, api: "TisV2Api") -> None:
+        if self.output_style == base.OutputStyle.MINIMAL:
+            # Output is discarded anyway; skip building (and filtering) the JobInfo models.
+            api.admin_list_jobs(self.states, parse_response=False)
+            return
+
         jobs = api.admin_list_jobs(self.states)
         jobs = base.filter_jobs(jobs, self.start_time, self.end_time)
         self.output(api.cli, jobs)
 
 
-@dataclass
+@dataclass(slots=True)
 class AdminKillAll(AdminArgs):
-    def run_subcommand(self, api: TisV2Api) -> None:
+    def run_subcommand(self, api: "TisV2Api") -> None:
         response = api.admin_kill_all()
         self.output(api.cli, response)
 
@@ -91,7 +106,7 @@ def register_admin_parser(subparsers: base.Subparser) -> None:
 
     admin_list_jobs = admin_parsers.add_parser(AdminCommand.LIST_JOBS, help="List jobs from all users.")
     base.register_server_variable(admin_list_jobs)
-    admin_list_jobs.add_argument("--state"     , help="Job state filter.", choices=[ state for state in AdminListJobsState ], required=True, action="append")
+    admin_list_jobs.add_argument("--state"     , help="Job state filter.", choices=_ADMIN_JOB_STATE_CHOICES, required=True, action="append")
     admin_list_jobs.add_argument("--start-time", help="Only display results for jobs that were running after this time." , type=check_datetime, default=None)
     admin_list_jobs.add_argument("--end-time"  , help="Only display results for jobs that were running before this time.", type=check_datetime, default=None)
 
@@ -6,16 +6,19 @@ Provides user-level commands for interacting with the user's own jobs.
 from datetime import datetime
 from pathlib import Path
 from enum import StrEnum
-from dataclasses import dataclass, asdict
-from typing import Any
+from dataclasses import dataclass, field, asdict
+from typing import TYPE_CHECKING, Any
 
 from local.server import Server
-from local.api import TisV2Api
 from local.request_schema import JobParams, Build, Phasing, Mode
-from local.util import check_file, check_datetime
+from local.response_schema import JobInfo, TERMINAL_JOB_STATES
+from local.util import check_files, check_datetime
 
 from . import base
 
+if TYPE_CHECKING:
+    from local.api import TisV2Api
+
 
 class JobCommand(StrEnum):
     LIST     = "list"
@@ -26,65 +29,97 @@ class JobCommand(StrEnum):
     DOWNLOAD = "download"
 
 
-@dataclass
+@dataclass(slots=True)
 class JobArgs(base.ApiArgs):
     job_command: JobCommand
 
 
-@dataclass
+@dataclass(slots=True)
 class JobList(JobArgs):
+    parallel_safe = True
+
     start_time : datetime | None
     end_time   : datetime | None
 
-    def run_subcommand(self, api: TisV2Api) -> None:
-        jobs = api.list_jobs()
+    def run_subcommand(self, api: "TisV2Api") -> None:
+        if self.output_style == base.OutputStyle.MINIMAL:
+            # Output is discarded anyway; skip building (and filtering) the JobInfo models.
+            api.list_jobs(self.start_time, self.end_time, parse_response=False)
+            return
+
+        jobs = api.list_jobs(self.start_time, self.end_time)
+        # Keep the client-side filter as a backstop: servers without time-filter support
+        # ignore the query parameters and return the full list.
         jobs = base.filter_jobs(jobs, self.start_time, self.end_time)
         self.output(api.cli, jobs)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobGet(JobArgs):
+    parallel_safe = True
+
     job_id: str
 
-    def run_subcommand(self, api: TisV2Api) -> None:
+    # Last terminal response, cached on the instance so the cache cannot outlive this
+    # invocation: jobs still change server-side across runs (notification transitions,
+    # retention expiry), so a persistent cache would serve stale results.
+    _terminal_job : JobInfo | None = field(init=False, default=None, repr=False)
+
+    def run_subcommand(self, api: "TisV2Api") -> bool | None:
+        # Once a job is done running it never resumes, so repeats within this process skip
+        # the network round-trip. Returning `False` on a terminal state also stops the
+        # --repeat loop: further polls are wasted RPCs.
+        if self._terminal_job is not None:
+            self.output(api.cli, self._terminal_job)
+            return False
+
         job = api.get_job(self.job_id)
+
+        if job.state in TERMINAL_JOB_STATES:
+            self._terminal_job = job
+            self.output(api.cli, job)
+            return False
+
         self.output(api.cli, job)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobCancel(JobArgs):
     job_id: str
 
-    def run_subcommand(self, api: TisV2Api) -> None:
+    def run_subcommand(self, api: "TisV2Api") -> None:
         job = api.cancel_job(self.job_id)
         self.output(api.cli, job)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobRestart(JobArgs):
     job_id: str
 
-    def run_subcommand(self, api: TisV2Api) -> None:
+    def run_subcommand(self, api: "TisV2Api") -> None:
         response = api.restart_job(self.job_id)
         self.output(api.cli, response)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobSubmit(JobArgs):
     job_params: JobParams
 
-    def run_subcommand(self, api: TisV2Api) -> None:
+    def run_subcommand(self, api: "TisV2Api") -> None:
         response = api.submit_job(self.job_params)
         self.output(api.cli, response)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobDownload(JobArgs):
-    download_dir: Path
+    download_dir: Path | None
     job_id: str
 
-    def run_subcommand(self, api: TisV2Api) -> None:
-        response = api.download(self.download_dir, self.job_id)
+    def run_subcommand(self, api: "TisV2Api") -> None:
+        # The cwd fallback resolves here, at download time, instead of eagerly during parser
+        # construction (where every invocation - download or not - paid the realpath syscalls).
+        download_dir = self.download_dir if self.download_dir is not None else Path(".").resolve()
+        response = api.download(download_dir, self.job_id)
         self.output(api.cli, response)
 
 
@@ -111,7 +146,8 @@ def register_job_parser(subparsers: base.Subparser) -> None:
 
     submit_job = job_parsers.add_parser(JobCommand.SUBMIT, help="Submit a job for processing.")
     base.register_server_variable(submit_job)
-    submit_job.add_argument("-f", "--file"          , help="VCF file to upload for testing. Repeat for a multi-file upload."      , type=check_file, required=True, action="append")
+    # Collected as plain paths; the whole batch is validated concurrently in parse_job_command (see check_files).
+    submit_job.add_argument("-f", "--file"          , help="VCF file to upload for testing. Repeat for a multi-file upload."      , type=Path      , required=True, action="append")
     submit_job.add_argument("-r", "--refpanel"      , help="Reference panel used for imputation."                                 , type=str       , required=True)
     submit_job.add_argument("-b", "--build"         , help="Data format (HG19 vs. HG38)."                                         , type=Build     , default=None)
     submit_job.add_argument("-n", "--name"          , help="Optional name for this job (will be assigned a unique ID regardless).", type=str       , default=None)
@@ -125,7 +161,7 @@ def register_job_parser(subparsers: base.Subparser) -> None:
 
     download_job = job_parsers.add_parser(JobCommand.DOWNLOAD, help="Download all files for the given job.")
     base.register_server_variable(download_job)
-    download_job.add_argument("--download-dir", help="Directory used for file downloads. If the job contains outputs, a sub-dir named <job-id>/ will be created, and used to store all outputs.", type=Path, default=Path(".").resolve())
+    download_job.add_argument("--download-dir", help="Directory used for file downloads. If the job contains outputs, a sub-dir named <job-id>/ will be created, and used to store all outputs. Defaults to the working directory.", type=Path, default=None)
     download_job.add_argument("job_id", help="ID of the job to download.")
 
 
@@ -153,7 +189,7 @@ def parse_job_command(raw_args: Any, global_args: base.Args) -> JobArgs:
             job_params = JobParams(
                 refpanel       = refpanel,
                 population     = population.id,
-                files          = raw_args.file,
+                files          = check_files(raw_args.file),
                 job_name       = raw_args.name,
                 build          = raw_args.build,
                 r2_filter      = raw_args.r2_filter,
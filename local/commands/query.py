@@ -4,19 +4,22 @@ Provides user-level commands to query the server for non-job information.
 
 from enum import StrEnum
 from dataclasses import dataclass, asdict
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from local.server import Server
 
 from . import base
 
+if TYPE_CHECKING:
+    from local.api import TisV2Api
+
 
 class QueryCommand(StrEnum):
     SERVER_INFO     = "server-info"
     CALLER_IDENTITY = "caller-identity"
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryArgs(base.ApiArgs):
     query_command: QueryCommand
 
@@ -30,9 +33,11 @@ class ServerInfo:
     maintenance_message : str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryServerInfo(QueryArgs):
-    def run_subcommand(self, api: base.TisV2Api) -> None:
+    parallel_safe = True
+
+    def run_subcommand(self, api: "TisV2Api") -> None:
         response = api.get_server_info()
         server_info = ServerInfo(
             url                 = self.server.url,
@@ -44,9 +49,11 @@ class QueryServerInfo(QueryArgs):
         self.output(api.cli, server_info)
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryCallerIdentity(QueryArgs):
-    def run_subcommand(self, api: base.TisV2Api) -> None:
+    parallel_safe = True
+
+    def run_subcommand(self, api: "TisV2Api") -> None:
         response = api.get_server_info()
         user = response.user
         assert user is not None # Would mean we're not logged in, which should not be possible.
@@ -20,12 +20,12 @@ class ServerCommand(StrEnum):
     REGISTER = "register"
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerArgs(base.Args):
     server_command: ServerCommand
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerRegister(ServerArgs):
     id  : str
     url : str
@@ -45,7 +45,7 @@ class ServerRegister(ServerArgs):
 
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerShow(ServerArgs):
     name: str | None
 
@@ -13,8 +13,10 @@ from local.util import get_project_info
 from . import base
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionArgs(base.Args):
+    parallel_safe = True
+
     def run_command(self, cli: PrettyCli) -> None:
         project_info = get_project_info()
         self.output(cli, project_info.version)
@@ -54,49 +54,55 @@ class JobParams:
     meta_file      : bool    | None = None
     password       : str     | None = None
 
+    # Cached result of building the non-file form fields; they only depend on the (frozen
+    # in practice) params above, so repeated submissions reuse them. Not a dataclass field.
+    _static_params = None
+
     def get_params(self) -> list[tuple[str, tuple]]:
         """
         Returns a list of form fields in the format expected by the `files` parameter in `requests.post()`.
 
         * Skips `None` fields.
         * Opens handles for all files in `self.files`. The file contents will be uploaded as octet streams.
+        * The non-file fields are built once and cached; only the file handles are fresh per call.
         """
 
         assert len(self.population) > 0
         assert len(self.files) > 0
 
-        form_fields = {
-            "refpanel"      : self.refpanel.id,
-            "population"    : self.population,
-            "job-name"      : self.job_name,
-            "build"         : self.build,
-            "r2Filter"      : self.r2_filter,
-            "phasing"       : self.phasing,
-            "mode"          : self.mode,
-            "aesEncryption" : self.aes_encryption,
-            "meta"          : self.meta_file,
-            "password"      : self.password,
-        }
+        if self._static_params is None:
+            form_fields = {
+                "refpanel"      : self.refpanel.id,
+                "population"    : self.population,
+                "job-name"      : self.job_name,
+                "build"         : self.build,
+                "r2Filter"      : self.r2_filter,
+                "phasing"       : self.phasing,
+                "mode"          : self.mode,
+                "aesEncryption" : self.aes_encryption,
+                "meta"          : self.meta_file,
+                "password"      : self.password,
+            }
 
-        params = []
+            params = []
 
-        for (header, value) in form_fields.items():
-            if value is None:
-                continue
+            for (header, value) in form_fields.items():
+                if value is None:
+                    continue
 
-            value = str(value).strip()
+                value = str(value).strip()
 
-            if len(value) == 0:
-                continue
+                if len(value) == 0:
+                    continue
 
-            #        header   file  value
-            entry = (header, (None, value))
-            params.append(entry)
+                #        header   file  value
+                entry = (header, (None, value))
+                params.append(entry)
 
-        #            header    name       data              MIME-type
-        params += [ ("files", (str(file), open(file, "rb"), "application/octet-stream")) for file in self.files ]
+            self._static_params = params
 
-        return params
+        #                                header    name       data              MIME-type
+        return self._static_params + [ ("files", (str(file), open(file, "rb"), "application/octet-stream")) for file in self.files ]
 
 
 # ================================ OTHER ================================ #
@@ -37,6 +37,16 @@ class JobState(Enum):
     DELETED          = 10
 
 
+# States that end a job's run: once reached, the job will never go back to executing on
+# its own, so polling loops can stop. Note that jobs can still move *within* this set
+# (e.g. SUCCESS -> SUCCESS_NOTIFIED, or SUCCESS -> RETIRED when retention expires), so
+# "terminal" means "done running", not "frozen forever".
+TERMINAL_JOB_STATES = frozenset({
+    JobState.SUCCESS, JobState.FAILED, JobState.CANCELED, JobState.RETIRED,
+    JobState.SUCCESS_NOTIFIED, JobState.FAIL_NOTIFIED, JobState.DELETED,
+})
+
+
 @dataclass
 class MessageInfo:
     success : bool
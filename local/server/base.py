@@ -47,11 +47,13 @@ class Server:
         return self.refpanel_lookup[refpanel_norm]
 
 
+# Deletion table for normalize_name(): drops the common joiners `-_.` and ASCII whitespace.
+_NORMALIZE_TRANS = str.maketrans("", "", "-_. \t\n\r\v\f")
+
+
 def normalize_name(name: str) -> str:
     """Produces a normalized name representation that ignores whitespace, casing, and the common joiners `-_.`"""
 
-    without_whitespace = "".join(name.split()) # Also removes internal whitespace
-    without_punctuation = without_whitespace.replace("-", "").replace("_", "").replace(".", "") # Removes [-_.]+
-    lowercase = without_punctuation.lower()
-
-    return lowercase
+    # A single C-level translate() pass replaces the old split/join + three replace() calls
+    # (one intermediate string instead of five). normalize_name() runs on every lookup key.
+    return name.translate(_NORMALIZE_TRANS).lower()
@@ -4,12 +4,12 @@ Provides server lookup and registration utilities:
 """
 
 
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from local.util import flatten_for_storage
 
 from .base import Population, RefPanel, Server, normalize_name
@@ -19,6 +19,27 @@ from .register import register_defaults, maybe_update_server
 _servers       : dict[str, Server] | None = None # Canonical mapping: (original ID) -> server
 _server_lookup : dict[str, Server] | None = None # Lookup: (any possible NORMALIZED name) -> server
 
+_DATA_DIR     = Path("data")
+_SERVERS_FILE = _DATA_DIR / "servers.yaml"
+
+_data_dir_checked : bool = False # Set once _ensure_data_dir() has verified the directory exists.
+
+_load_lock = threading.Lock() # Guards _load_servers() so a prewarm thread and a synchronous caller don't race.
+
+
+def _ensure_data_dir() -> None:
+    """Creates the `data/` directory if needed. The `is_dir()` stat runs only once per process."""
+
+    global _data_dir_checked
+
+    if _data_dir_checked:
+        return
+
+    if not _DATA_DIR.is_dir():
+        _DATA_DIR.mkdir(parents=False, exist_ok=False)
+
+    _data_dir_checked = True
+
 
 def _get_dict_field(dictionary: dict[str, Any], key: str, value_type: type, key_missing_message: str, value_wrong_type_message: str) -> Any:
     if not key in dictionary:
@@ -43,18 +64,17 @@ def _load_servers() -> None:
     # File Loading
     # ================================================================ #
 
-    data_dir = Path("data")
-
-    if not data_dir.is_dir():
-        data_dir.mkdir(parents=False, exist_ok=False)
+    _ensure_data_dir()
 
-    servers_file = data_dir / "servers.yaml"
-
-    if not servers_file.is_file():
+    if not _SERVERS_FILE.is_file():
         register_defaults()
         return
 
-    with open(servers_file, "r") as file_handle:
+    # Imported here: commands that never touch the registry (version, --help) skip the
+    # yaml import cost entirely.
+    import yaml
+
+    with open(_SERVERS_FILE, "r") as file_handle:
         data = yaml.load(file_handle, Loader=yaml.SafeLoader)
 
     # We treat an empty YAML file the same as a missing file.
@@ -212,8 +232,11 @@ def _load_servers() -> None:
 def _check_servers() -> None:
     """If `_servers` is still `None`, call `load_servers()`."""
     if _servers is None:
-        assert _server_lookup is None # If _servers is not loaded, _server_lookup should also not be loaded.
-        _load_servers()
+        with _load_lock:
+            # Re-check inside the lock: a prewarm thread may have loaded while we waited.
+            if _servers is None:
+                assert _server_lookup is None # If _servers is not loaded, _server_lookup should also not be loaded.
+                _load_servers()
 
     assert _servers is not None # load_servers() should throw or load.
     assert _server_lookup is not None # load_servers() should throw or load.
@@ -257,13 +280,17 @@ def dump_servers_to_file() -> None:
     assert _servers is not None
     assert _server_lookup is not None
 
-    data_dir = Path("data")
+    import yaml
 
-    if not data_dir.is_dir():
-        data_dir.mkdir(parents=False, exist_ok=False)
+    _ensure_data_dir()
 
-    servers_file = data_dir / "servers.yaml"
     server_data = { "servers": flatten_for_storage(_servers, skip_keys={ "refpanel-lookup", "id" }) }
 
-    with open(servers_file, "w") as file_handle:
+    # Write-then-rename so the registry file is replaced atomically: an interrupted dump
+    # leaves the old file intact instead of a truncated YAML that breaks every later load.
+    temp_file = _SERVERS_FILE.with_suffix(".yaml.tmp")
+
+    with open(temp_file, "w") as file_handle:
         yaml.safe_dump(server_data, file_handle)
+
+    os.replace(temp_file, _SERVERS_FILE)
@@ -8,8 +8,6 @@ Provides `register_server()`, `register_defaults()`.
 from datetime import datetime, timedelta
 from urllib.parse import urlparse, urlunparse
 
-from local.api import TisV2Api
-
 from . import lookup, base
 
 
@@ -28,6 +26,10 @@ def force_server_update(server: base.Server) -> None:
 
     start_time = datetime.now()
 
+    # Imported here: most invocations never refresh a server, and keeping the requests
+    # stack off the module path also breaks the local.api <-> local.server import cycle.
+    from local.api import TisV2Api
+
     # TODO: We should propagate `cli` and verbosity params from upstream!
     api = TisV2Api(env_name=server.id, base_url=server.url)
     refpanel_response = api.list_refpanels()
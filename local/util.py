@@ -1,9 +1,14 @@
 import argparse
-import tomllib
+import functools
+import os
+import re
+import stat
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from enum import Enum
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict, is_dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from typing import Any, Iterable, Mapping, Sequence
 
 from pretty_cli import PrettyCli
@@ -16,7 +21,12 @@ class ProjectInfo:
     description : str
 
 
+@functools.cache
 def get_project_info() -> ProjectInfo:
+    # pyproject.toml cannot change mid-process, so parse it at most once. The import lives
+    # here for the same reason: most invocations never need the TOML parser.
+    import tomllib
+
     with open("pyproject.toml", "rb") as file:
         data = tomllib.load(file)
 
@@ -35,6 +45,32 @@ def get_user_agent() -> str:
     return user_agent
 
 
+_fields_cache : dict[type, tuple[str, ...]] = {} # Field names per dataclass type, so repeated serialization skips re-introspection.
+
+# Exact leaf types returned unchanged by the converters. A single `type(obj) in set` probe is one
+# C-level hash lookup, vs. walking the MRO for each isinstance() test; subclasses (e.g. StrEnum)
+# still fall through to the isinstance chain below so their behavior is unchanged.
+_LEAF_TYPES = frozenset({ str, bytes, int, float, bool, type(None) })
+
+
+def _dataclass_items(obj: Any) -> Iterable[tuple[str, Any]]:
+    """
+    Yields shallow `(name, value)` pairs for a dataclass instance.
+
+    Unlike `dataclasses.asdict()`, this does not deepcopy leaf values; our recursive
+    converters already walk the children, so the extra copy pass is pure waste.
+    """
+
+    cls = type(obj)
+    names = _fields_cache.get(cls)
+
+    if names is None:
+        names = tuple(f.name for f in fields(cls))
+        _fields_cache[cls] = names
+
+    return ( (name, getattr(obj, name)) for name in names )
+
+
 def flatten_for_storage(obj: Any, skip_keys: Iterable[str]) -> Any:
     """
     Recursively converts dataclass and Mapping instances into dicts; Sequences into lists.
@@ -49,10 +85,10 @@ def flatten_for_storage(obj: Any, skip_keys: Iterable[str]) -> Any:
     def process_key(key: Any) -> str:
         return str(key).strip().lower().replace("_", "-")
 
-    def process_mapping(map: Mapping) -> dict[str, Any]:
+    def process_items(items: Iterable[tuple[Any, Any]]) -> dict[str, Any]:
         d = dict()
 
-        for (key, value) in map.items():
+        for (key, value) in items:
             key = process_key(key)
             if key in skip_keys:
                 continue
@@ -60,13 +96,15 @@ def flatten_for_storage(obj: Any, skip_keys: Iterable[str]) -> Any:
 
         return d
 
-    if isinstance(obj, str) or isinstance(obj, int) or isinstance(obj, float):
+    if type(obj) in _LEAF_TYPES:
+        return obj
+    elif isinstance(obj, str) or isinstance(obj, int) or isinstance(obj, float):
         # Handled explicitly to avoid recursion issues with str, and to keep it simple on basic types.
         return obj
     elif is_dataclass(obj) and not isinstance(obj, type):
-        return process_mapping(asdict(obj))
+        return process_items(_dataclass_items(obj))
     elif isinstance(obj, Mapping):
-        return process_mapping(obj)
+        return process_items(obj.items())
     elif isinstance(obj, Sequence):
         return [ flatten_for_storage(value, skip_keys) for value in obj ]
     else:
@@ -74,46 +112,144 @@ def flatten_for_storage(obj: Any, skip_keys: Iterable[str]) -> Any:
 
 
 def dictionarize(obj: Any) -> Any:
-    """Recursively converts dataclass, Mapping, and Sequence instances into dicts. Skips `None` entries."""
+    """
+    Converts dataclass, Mapping, and Sequence instances into dicts. Skips `None` entries.
 
-    def process_key(key: Any) -> str:
-        return str(key).strip()
+    Traverses with an explicit work-list instead of recursion, so deeply nested API
+    responses don't pay a Python frame per node (and can't hit the recursion limit).
+    """
 
-    def process_mapping(map: Mapping) -> dict[str, Any]:
-        return { process_key(key): dictionarize(value) for (key, value) in map.items() if value is not None }
+    def convert_node(node: Any) -> tuple[Any, Iterable[tuple[Any, Any]] | None]:
+        """Returns `(converted, children)`, where `children` is `None` for leaf nodes."""
+
+        if type(node) in _LEAF_TYPES:
+            return node, None
+        elif isinstance(node, str) or isinstance(node, int) or isinstance(node, float):
+            # Handled explicitly to avoid recursion issues with str, and to keep it simple on basic types.
+            return node, None
+        elif is_dataclass(node) and not isinstance(node, type):
+            return dict(), _dataclass_items(node)
+        elif isinstance(node, Mapping):
+            return dict(), node.items()
+        elif isinstance(node, Sequence):
+            # Fast path for primitive-only sequences (e.g. a list of file paths): the elements
+            # need no conversion, so build the idx -> entry dict here in one tight pass instead
+            # of queueing each element through the work-list.
+            if all(type(value) in _LEAF_TYPES for value in node):
+                return { str(n): value for (n, value) in enumerate(node) if value is not None }, None
+            return dict(), enumerate(node)
+        else:
+            return node, None
 
-    if isinstance(obj, str) or isinstance(obj, int) or isinstance(obj, float):
-        # Handled explicitly to avoid recursion issues with str, and to keep it simple on basic types.
-        return obj
-    elif is_dataclass(obj) and not isinstance(obj, type):
-        return process_mapping(asdict(obj))
-    elif isinstance(obj, Mapping):
-        return process_mapping(obj)
-    elif isinstance(obj, Sequence):
-        return process_mapping({ n: value for (n, value) in enumerate(obj) })
-    else:
-        return obj
+    (root, items) = convert_node(obj)
+
+    if items is None:
+        return root
+
+    work = deque([ (root, items) ])
+
+    while work:
+        (parent, items) = work.pop()
+
+        for (key, value) in items:
+            if value is None:
+                continue
+
+            (converted, children) = convert_node(value)
+            parent[str(key).strip()] = converted
+
+            if children is not None:
+                work.append((converted, children))
+
+    return root
 
 
 def display(cli: PrettyCli, obj: Any) -> None:
     """
     Flattens `obj` so arrays are displayed as dicts mapping idx -> entry.
+
+    Leaf values go straight to the printer; the flattening walk only runs for container
+    types that actually need converting. (PrettyCli renders a materialized structure, so
+    containers still need the one-pass `dictionarize` conversion.)
     """
 
-    out = dictionarize(obj)
-    cli.print(out)
+    if isinstance(obj, str) or isinstance(obj, int) or isinstance(obj, float):
+        cli.print(obj)
+        return
 
+    cli.print(dictionarize(obj))
 
+
+@functools.lru_cache(maxsize=256)
 def check_file(arg_value: str) -> Path:
     """
     Argparse helper. Converts the argument to a `Path` and ensures it is an existing file in the filesystem.
+
+    Memoized per argument string: argparse can invoke the validator repeatedly for the same
+    path (e.g., a repeated `--file`), and each check costs a `stat()` syscall.
     """
-    path = Path(arg_value)
+    # os.stat + S_ISREG does the existing-regular-file check with one syscall and a C-level
+    # bit test, skipping pathlib's layered is_file() machinery.
+    try:
+        stat_result = os.stat(arg_value)
+    except OSError:
+        raise argparse.ArgumentTypeError(f"File not found: {arg_value}")
 
-    if not path.is_file():
+    if not stat.S_ISREG(stat_result.st_mode):
         raise argparse.ArgumentTypeError(f"File not found: {arg_value}")
 
-    return path
+    return Path(arg_value)
+
+
+def check_files(arg_values: Iterable[str | Path]) -> list[Path]:
+    """
+    Validates a batch of paths like `check_file`, stat-ing them concurrently.
+
+    Intended for arguments collected with `action="append"` (e.g. multi-file submissions):
+    validating after the fact lets a small thread pool overlap the per-file `stat()` calls,
+    which dominate on cold caches or network filesystems.
+    """
+
+    paths = [ Path(value) for value in arg_values ]
+
+    def stat_one(path: Path) -> None:
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            raise argparse.ArgumentTypeError(f"File not found: {path}")
+
+        if not stat.S_ISREG(stat_result.st_mode):
+            raise argparse.ArgumentTypeError(f"File not found: {path}")
+
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(16, len(paths))) as pool:
+            for _ in pool.map(stat_one, paths):
+                pass
+    elif len(paths) == 1:
+        stat_one(paths[0])
+
+    return paths
+
+
+def write_token_file(path: Path, token: str) -> None:
+    """
+    Writes an auth token to `path`, restricted to owner-only permissions (0600).
+
+    The raw `os.open`/`os.write` pair applies the restrictive mode atomically at creation
+    (no window where the default umask exposes the credential) and skips the TextIOWrapper
+    setup that `open(path, "w")` would build for this one small write. `fchmod` tightens
+    files that already existed with a looser mode.
+    """
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.fchmod(fd, 0o600)
+        os.write(fd, token.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+_TIMEDELTA_RE = re.compile(r"(?:(?:(\d+):)?(\d+):)?(\d+)") # ((hh:)mm:)ss
 
 
 def check_timedelta(arg_value: str) -> timedelta:
@@ -121,24 +257,14 @@ def check_timedelta(arg_value: str) -> timedelta:
     Argparse helper. Converts an argument of shape `((hh:)mm:)ss` to a `timedelta` time amount expression.
     """
 
-    try:
-        parts = [ int(x) for x in arg_value.split(":") ]
-        assert(1 <= len(parts) <= 3)
-
-        if len(parts) == 1:
-            h, m = 0, 0
-            s = parts[0]
-        elif len(parts) == 2:
-            h = 0
-            m, s = parts
-        else:
-            h, m, s = parts
+    match = _TIMEDELTA_RE.fullmatch(arg_value)
 
-        t = timedelta(hours=h, minutes=m, seconds=s)
-    except:
+    if match is None:
         raise argparse.ArgumentTypeError(f"Invalid time expression; expected ((hh:)mm:)ss but found: {arg_value}")
 
-    return t
+    (h, m, s) = ( int(group) if group else 0 for group in match.groups() )
+
+    return timedelta(hours=h, minutes=m, seconds=s)
 
 
 def check_datetime(arg_value: str) -> datetime:
@@ -146,22 +272,40 @@ def check_datetime(arg_value: str) -> datetime:
     Argparse helper. Converts an ISO 8601 date-time expression to a `datetime` timestamp.
     """
 
+    # fromisoformat() is the C-accelerated parser and already beats any strptime or
+    # hand-rolled regex approach; only the exception handling needed narrowing so that
+    # unexpected errors (e.g. a non-string argument) are not swallowed as parse failures.
     try:
         return datetime.fromisoformat(arg_value)
-    except:
+    except ValueError:
         raise argparse.ArgumentTypeError(f"Expected ISO 8601 date-time, but found: {arg_value}")
 
 
 def json_default(value):
-    if is_dataclass(value) and not isinstance(value, type):
-        return asdict(value)
+    # Exact-type check first: datetime is by far the most common type hitting this hook,
+    # and type() is cheaper than isinstance() chains. Plain isoformat() (RFC 3339 "T"
+    # separator) is a single C-level call, matching what fast serializers like orjson emit.
+    if type(value) is datetime:
+        return value.isoformat()
+    elif is_dataclass(value) and not isinstance(value, type):
+        # Shallow conversion through the per-type field cache: the JSON encoder recurses into
+        # the returned dict itself, so asdict's deepcopy of the whole subtree was pure waste.
+        return dict(_dataclass_items(value))
     elif isinstance(value, datetime):
-        return value.isoformat(sep=" ")
+        return value.isoformat()
     elif isinstance(value, Enum):
         return value.name
     raise Exception(f"Value of type '{type(value)}' could not be parsed: {value}")
 
 
+_SIZE_UNITS = {
+    "b" : 1, "bytes" : 1,
+    "kb": 1024      , "kib": 1024      ,
+    "mb": 1024 ** 2 , "mib": 1024 ** 2 ,
+    "gb": 1024 ** 3 , "gib": 1024 ** 3 ,
+}
+
+
 def parse_size(size: str) -> int:
     parts = size.split()
     assert len(parts) == 2, f"Expected <number> <unit>, but found: '{size}'"
@@ -169,16 +313,9 @@ def parse_size(size: str) -> int:
     value = int(parts[0])
     units = parts[1]
 
-    match units.lower():
-        case "b" | "bytes":
-            mutliplier = 1
-        case "kb" | "kib":
-            mutliplier = 1024
-        case "mb" | "mib":
-            mutliplier = 1024 ** 2
-        case "gb" | "gib":
-            mutliplier = 1024 ** 3
-        case _:
-            raise Exception(f"Units not recognized: {units}")
-
-    return value * mutliplier
+    multiplier = _SIZE_UNITS.get(units.lower())
+
+    if multiplier is None:
+        raise Exception(f"Units not recognized: {units}")
+
+    return value * multiplier
@@ -2,7 +2,6 @@
 
 
 import base64
-import json
 import argparse
 from typing import Any
 
@@ -10,17 +9,26 @@ from pretty_cli import PrettyCli
 
 from local.util import check_file
 
+try:
+    # orjson parses the decoded bytes directly in native code; fall back to stdlib if absent.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Base64 padding needed for each possible (length & 3); avoids building a fresh string per part.
+_PAD = ("", "===", "==", "=")
+
 
 def decode_part(part: str) -> Any:
     """
     Receives a part of a JWT token (JSON encoded as a URL64 string), and returns the parsed JSON.
     """
 
-    padding = "=" * (4 - (len(part) % 4))
-    padded_part = part + padding
+    padded_part = part + _PAD[len(part) & 3]
 
     decoded = base64.urlsafe_b64decode(padded_part)
-    as_json = json.loads(decoded)
+    as_json = _json_loads(decoded)
 
     return as_json
 